@@ -172,13 +172,15 @@ def _setup_common_distrib_training_handlers(
     if not (dist.is_available() and dist.is_initialized()):
         raise RuntimeError("Distributed setting is not initialized, please call `dist.init_process_group` before.")
 
+    rank = dist.get_rank()
+
     _setup_common_training_handlers(
         trainer,
         to_save=None,
         lr_scheduler=lr_scheduler,
         with_gpu_stats=with_gpu_stats,
         output_names=output_names,
-        with_pbars=(dist.get_rank() == 0) and with_pbars,
+        with_pbars=(rank == 0) and with_pbars,
         with_pbar_on_iters=with_pbar_on_iters,
         log_every_iters=log_every_iters,
         device=device,
@@ -192,7 +194,7 @@ def _setup_common_distrib_training_handlers(
         def distrib_set_epoch(engine):
             train_sampler.set_epoch(engine.state.epoch - 1)
 
-    if dist.get_rank() == 0:
+    if rank == 0:
         if to_save is not None:
             if output_path is None:
                 raise ValueError("If to_save argument is provided then output_path argument should be also defined")
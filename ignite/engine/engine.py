@@ -128,7 +128,8 @@ class Engine(Serializable):
         self.should_terminate_single_epoch = False
         self.state = State()
         self._state_dict_user_keys = []
-        self._allowed_events = []
+        # insertion-ordered dict used as an ordered set: constant time membership checks on every fired event
+        self._allowed_events = {}
 
         self._dataloader_iter = None
         self._init_iter = []
@@ -193,7 +194,7 @@ class Engine(Serializable):
             raise ValueError("Expected event_to_attr to be dictionary. Got {}.".format(type(event_to_attr)))
 
         for e in event_names:
-            self._allowed_events.append(e)
+            self._allowed_events[e] = None
             if event_to_attr and e in event_to_attr:
                 State.event_to_attr[e] = event_to_attr[e]
         # we need to update state attributes associated with new custom events
@@ -391,7 +392,7 @@ class Engine(Serializable):
             for func, args, kwargs in self._event_handlers[event_name]:
                 kwargs.update(event_kwargs)
                 first, others = ((args[0],), args[1:]) if (args and args[0] == self) else ((), args)
-                func(*first, *(event_args + others), **kwargs)
+                func(*first, *event_args, *others, **kwargs)
 
     def fire_event(self, event_name: Any) -> None:
         """Execute all the handlers associated with given event.
@@ -209,8 +209,7 @@ class Metric(metaclass=ABCMeta):
         else:
             raise TypeError("Unhandled input type {}".format(type(tensor)))
 
-        # synchronize and reduce
-        dist.barrier()
+        # all_reduce is itself a synchronization point, no need for an extra barrier
         dist.all_reduce(tensor)
 
         if tensor_to_number:
@@ -481,13 +480,32 @@ def sync_all_reduce(*attrs) -> Callable:
                     "Decorator sync_all_reduce should be used on " "ignite.metric.Metric class methods only"
                 )
 
-            if len(attrs) > 0 and not self._is_reduced:
+            # Nothing to reduce in non-distributed configuration: skip the per-attribute probes
+            if len(attrs) > 0 and not self._is_reduced and dist.is_available() and dist.is_initialized():
+                numbers_attrs = []
                 for attr in attrs:
                     t = getattr(self, attr, None)
-                    if t is not None:
-                        t = self._sync_all_reduce(t)
-                        self._is_reduced = True
-                        setattr(self, attr, t)
+                    if t is None:
+                        continue
+                    if isinstance(t, numbers.Number):
+                        numbers_attrs.append((attr, t))
+                        continue
+                    t = self._sync_all_reduce(t)
+                    self._is_reduced = True
+                    setattr(self, attr, t)
+
+                if len(numbers_attrs) > 0:
+                    # Reduce all scalar attributes with a single collective call. Integer-only scalars are reduced
+                    # exactly as int64, otherwise integers go through float64 and lose precision above 2 ** 53.
+                    if all(isinstance(v, numbers.Integral) for _, v in numbers_attrs):
+                        dtype = torch.int64
+                    else:
+                        dtype = torch.float64
+                    values = torch.tensor([v for _, v in numbers_attrs], dtype=dtype, device=self._device)
+                    values = self._sync_all_reduce(values).tolist()
+                    for (attr, v), reduced_v in zip(numbers_attrs, values):
+                        setattr(self, attr, int(reduced_v) if isinstance(v, numbers.Integral) else reduced_v)
+                    self._is_reduced = True
 
             return func(self, *args, **kwargs)
 
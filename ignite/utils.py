@@ -186,6 +186,11 @@ def one_rank_only(rank: int = 0, barrier: bool = False):
         @wraps(func)
         def wrapper(*args, **kwargs):
             ret = None
+            if not (dist.is_available() and dist.is_initialized()):
+                # Non-distributed configuration: single process of rank 0, nothing to synchronize
+                if rank == 0:
+                    ret = func(*args, **kwargs)
+                return ret
             if dist.get_rank() == rank:
                 ret = func(*args, **kwargs)
             if barrier:
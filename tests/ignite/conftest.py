@@ -39,12 +39,13 @@ def distributed_context_single_node_nccl(local_rank):
         "init_method": "tcp://localhost:2223",
     }
 
+    # Set device before any NCCL call, otherwise every process creates a CUDA context on device 0
+    torch.cuda.set_device(local_rank)
+
     dist.init_process_group(**dist_info)
 
     dist.barrier()
 
-    torch.cuda.device(local_rank)
-
     yield {"local_rank": local_rank}
 
     dist.barrier()
@@ -140,12 +141,13 @@ def distributed_context_multi_node_nccl(multi_node_conf):
         "rank": multi_node_conf["rank"],
     }
 
+    # Set device before any NCCL call, otherwise every process creates a CUDA context on device 0
+    torch.cuda.set_device(multi_node_conf["local_rank"])
+
     dist.init_process_group(**dist_info)
 
     dist.barrier()
 
-    torch.cuda.device(multi_node_conf["local_rank"])
-
     yield multi_node_conf
 
     dist.barrier()
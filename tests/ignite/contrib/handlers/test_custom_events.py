@@ -45,8 +45,8 @@ def test_new_events():
     assert hasattr(cpe.Events, "ITERATIONS_5_STARTED")
     assert hasattr(cpe.Events, "ITERATIONS_5_COMPLETED")
 
-    assert engine._allowed_events[-2] == getattr(cpe.Events, "ITERATIONS_5_STARTED")
-    assert engine._allowed_events[-1] == getattr(cpe.Events, "ITERATIONS_5_COMPLETED")
+    assert list(engine._allowed_events)[-2] == getattr(cpe.Events, "ITERATIONS_5_STARTED")
+    assert list(engine._allowed_events)[-1] == getattr(cpe.Events, "ITERATIONS_5_COMPLETED")
 
     cpe = CustomPeriodicEvent(n_epochs=5)
     cpe.attach(engine)
@@ -55,8 +55,8 @@ def test_new_events():
     assert hasattr(cpe.Events, "EPOCHS_5_STARTED")
     assert hasattr(cpe.Events, "EPOCHS_5_COMPLETED")
 
-    assert engine._allowed_events[-2] == getattr(cpe.Events, "EPOCHS_5_STARTED")
-    assert engine._allowed_events[-1] == getattr(cpe.Events, "EPOCHS_5_COMPLETED")
+    assert list(engine._allowed_events)[-2] == getattr(cpe.Events, "EPOCHS_5_STARTED")
+    assert list(engine._allowed_events)[-1] == getattr(cpe.Events, "EPOCHS_5_COMPLETED")
 
 
 def test_integration_iterations():
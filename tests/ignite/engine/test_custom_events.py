@@ -47,6 +47,42 @@ def test_custom_events():
     assert handle.called
 
 
+def test_allowed_events_lookup():
+    class CustomEvents(EventEnum):
+        TEST_EVENT = "test_event"
+
+    def process_func(engine, batch):
+        engine.fire_event(CustomEvents.TEST_EVENT)
+        engine.fire_event("string_event")
+
+    engine = Engine(process_func)
+    engine.register_events(*CustomEvents)
+    engine.register_events("string_event")
+
+    # registration order is kept
+    assert list(engine._allowed_events)[-2:] == [CustomEvents.TEST_EVENT, "string_event"]
+    assert CustomEvents.TEST_EVENT in engine._allowed_events
+    assert "string_event" in engine._allowed_events
+    # filtered events are looked up by their name
+    assert CustomEvents.TEST_EVENT(every=2) in engine._allowed_events
+    assert Events.ITERATION_COMPLETED(once=1) in engine._allowed_events
+    assert "unknown_event" not in engine._allowed_events
+
+    custom_handle = MagicMock()
+    filtered_handle = MagicMock()
+    string_handle = MagicMock()
+    engine.add_event_handler(CustomEvents.TEST_EVENT, custom_handle)
+    engine.add_event_handler(Events.ITERATION_COMPLETED(every=2), filtered_handle)
+    engine.add_event_handler("string_event", string_handle)
+    engine.run(range(4))
+    assert custom_handle.call_count == 4
+    assert filtered_handle.call_count == 2
+    assert string_handle.call_count == 4
+
+    with pytest.raises(ValueError, match=r"is not a valid event for this Engine"):
+        engine.add_event_handler("unknown_event", MagicMock())
+
+
 def test_custom_events_with_event_to_attr():
     class CustomEvents(EventEnum):
         TEST_EVENT = "test_event"
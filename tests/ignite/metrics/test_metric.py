@@ -1,7 +1,7 @@
 import numbers
 import os
 import sys
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -585,6 +585,7 @@ def _test_distrib_sync_all_reduce_decorator(device):
             assert (self.b.cpu() == (self.b_nocomp - 5) * dist.get_world_size()).all()
             assert self.c == pytest.approx((self.c_nocomp + 1.23456) * dist.get_world_size())
             assert self.n == (self.n_nocomp + 1) * dist.get_world_size()
+            assert isinstance(self.n, int)
 
         @reinit__is_reduced
         def update(self, output):
@@ -600,6 +601,66 @@ def _test_distrib_sync_all_reduce_decorator(device):
     m.compute()
 
 
+def _test_distrib_sync_all_reduce_decorator_coalesced(device):
+
+    import torch.distributed as dist
+    from ignite.metrics.metric import sync_all_reduce, reinit__is_reduced
+
+    ws = dist.get_world_size()
+
+    class DummyMetric(Metric):
+        @reinit__is_reduced
+        def reset(self):
+            self.a = torch.tensor([0.0, 1.0], device=self._device, requires_grad=False)
+            self.c = 0.5
+            self.d = 1.25
+            self.n = 0
+            self.m = 2 ** 53 + 1
+
+        @sync_all_reduce("c", "d", "n")
+        def compute(self):
+            pass
+
+        @sync_all_reduce("m", "n")
+        def compute_integers(self):
+            pass
+
+        @sync_all_reduce("a", "c", "n")
+        def compute_mixed(self):
+            pass
+
+        @reinit__is_reduced
+        def update(self, output):
+            self.n += 1
+
+    with patch.object(dist, "all_reduce", wraps=dist.all_reduce) as all_reduce:
+        m = DummyMetric(device=device)
+        m.update(None)
+        m.compute()
+        assert all_reduce.call_count == 1
+        assert isinstance(m.c, float) and m.c == pytest.approx(0.5 * ws)
+        assert isinstance(m.d, float) and m.d == pytest.approx(1.25 * ws)
+        assert isinstance(m.n, int) and m.n == ws
+
+        all_reduce.reset_mock()
+        m = DummyMetric(device=device)
+        m.update(None)
+        m.compute_integers()
+        assert all_reduce.call_count == 1
+        assert isinstance(m.m, int) and m.m == (2 ** 53 + 1) * ws
+        assert isinstance(m.n, int) and m.n == ws
+
+        all_reduce.reset_mock()
+        m = DummyMetric(device=device)
+        m.update(None)
+        m.compute_mixed()
+        # one call for the tensor attribute and one for all scalar attributes
+        assert all_reduce.call_count == 2
+        assert (m.a.cpu() == torch.tensor([0.0, 1.0]) * ws).all()
+        assert isinstance(m.c, float) and m.c == pytest.approx(0.5 * ws)
+        assert isinstance(m.n, int) and m.n == ws
+
+
 @pytest.mark.distributed
 @pytest.mark.skipif(torch.cuda.device_count() < 1, reason="Skip if no GPU")
 def test_distrib_gpu(local_rank, distributed_context_single_node_nccl):
@@ -607,6 +668,7 @@ def test_distrib_gpu(local_rank, distributed_context_single_node_nccl):
     device = "cuda:{}".format(local_rank)
     _test_distrib__sync_all_reduce(device)
     _test_distrib_sync_all_reduce_decorator(device)
+    _test_distrib_sync_all_reduce_decorator_coalesced(device)
 
 
 @pytest.mark.distributed
@@ -615,6 +677,7 @@ def test_distrib_cpu(distributed_context_single_node_gloo):
     device = "cpu"
     _test_distrib__sync_all_reduce(device)
     _test_distrib_sync_all_reduce_decorator(device)
+    _test_distrib_sync_all_reduce_decorator_coalesced(device)
 
 
 @pytest.mark.multinode_distributed
@@ -623,6 +686,7 @@ def test_multinode_distrib_cpu(distributed_context_multi_node_gloo):
     device = "cpu"
     _test_distrib__sync_all_reduce(device)
     _test_distrib_sync_all_reduce_decorator(device)
+    _test_distrib_sync_all_reduce_decorator_coalesced(device)
 
 
 @pytest.mark.multinode_distributed
@@ -631,6 +695,7 @@ def test_multinode_distrib_gpu(distributed_context_multi_node_nccl):
     device = "cuda:{}".format(distributed_context_multi_node_nccl["local_rank"])
     _test_distrib__sync_all_reduce(device)
     _test_distrib_sync_all_reduce_decorator(device)
+    _test_distrib_sync_all_reduce_decorator_coalesced(device)
 
 
 def test_completed():
@@ -118,6 +118,24 @@ def test_setup_logger(capsys, dirname):
         assert "evaluator INFO: Engine run starting with max_epochs=1." in source[2]
 
 
+def test_one_rank_only_non_distributed():
+    values = []
+
+    @one_rank_only(barrier=True)
+    def rank_0_handler():
+        values.append(0)
+        return 0
+
+    @one_rank_only(rank=1, barrier=True)
+    def rank_1_handler():
+        values.append(1)
+        return 1
+
+    assert rank_0_handler() == 0
+    assert rank_1_handler() is None
+    assert values == [0]
+
+
 def _test_distrib_one_rank_only(device):
     def _test(barrier):
         # last rank